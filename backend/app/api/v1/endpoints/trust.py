@@ -26,6 +26,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["trust-scoring"])
 
 
+def _signals_to_rows(score_result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert scorer signals into trust signal rows for persistence."""
+    return [
+        {
+            "type": signal_type,
+            "value": signal_data["value"],
+            "weight": signal_data["weight"],
+            "explanation": f"{signal_type}: {signal_data['value']:.3f}",
+        }
+        for signal_type, signal_data in score_result["signals"].items()
+        if signal_data["value"] is not None
+    ]
+
+
 class TrustScoreRequest(BaseModel):
     """Request schema for trust score calculation."""
 
@@ -96,24 +110,11 @@ async def calculate_trust_score(
         trust_scorer = TrustScorer()
         score_result = await trust_scorer.calculate_score(story)
 
-        # Store trust signals in database
-        signals_for_db = []
-        for signal_type, signal_data in score_result["signals"].items():
-            if signal_data["value"] is not None:
-                signals_for_db.append(
-                    {
-                        "type": signal_type,
-                        "value": signal_data["value"],
-                        "weight": signal_data["weight"],
-                        "explanation": f"{signal_type}: {signal_data['value']:.3f}",
-                    }
-                )
-
-        # Update story trust score
+        # Store trust signals and update story trust score
         await story_service.update_trust_score(
             request.story_id,
             score_result["score"] * 100,  # Convert to 0-100 scale for DB
-            signals_for_db,
+            _signals_to_rows(score_result),
         )
 
         # Broadcast update via WebSocket
@@ -198,20 +199,8 @@ async def get_current_trust_score(
             score_result = await trust_scorer.calculate_score(story)
 
             # Update database
-            signals_for_db = []
-            for signal_type, signal_data in score_result["signals"].items():
-                if signal_data["value"] is not None:
-                    signals_for_db.append(
-                        {
-                            "type": signal_type,
-                            "value": signal_data["value"],
-                            "weight": signal_data["weight"],
-                            "explanation": f"{signal_type}: {signal_data['value']:.3f}",
-                        }
-                    )
-
             await story_service.update_trust_score(
-                story_id, score_result["score"] * 100, signals_for_db
+                story_id, score_result["score"] * 100, _signals_to_rows(score_result)
             )
 
             return TrustScoreResponse(**score_result)
@@ -321,22 +310,10 @@ async def bulk_calculate_trust_scores(
                 score_result = await trust_scorer.calculate_score(story)
 
                 # Update database
-                signals_for_db = []
-                for signal_type, signal_data in score_result["signals"].items():
-                    if signal_data["value"] is not None:
-                        signals_for_db.append(
-                            {
-                                "type": signal_type,
-                                "value": signal_data["value"],
-                                "weight": signal_data["weight"],
-                                "explanation": (
-                                    f"{signal_type}: {signal_data['value']:.3f}"
-                                ),
-                            }
-                        )
-
                 await story_service.update_trust_score(
-                    story_id, score_result["score"] * 100, signals_for_db
+                    story_id,
+                    score_result["score"] * 100,
+                    _signals_to_rows(score_result),
                 )
 
                 results.append(
@@ -1,3 +1,3 @@
-from app.services.scoring.trust_scorer import TrustScorer
+from app.services.scoring.trust_scorer import SIGNAL_TYPES, TrustScorer
 
-__all__ = ["TrustScorer"]
+__all__ = ["SIGNAL_TYPES", "TrustScorer"]
@@ -8,17 +8,128 @@ correlation to generate dynamic trust scores.
 
 from __future__ import annotations
 
+import bisect
 import logging
-import statistics
-from collections import defaultdict
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 if TYPE_CHECKING:
     from app.schemas.story import StoryResponse
 
 logger = logging.getLogger(__name__)
 
+# Weight of each trust signal in the composite score, in scoring order
+_SIGNAL_WEIGHTS = {
+    "source_credibility": 0.25,
+    "velocity_pattern": 0.20,
+    "cross_platform_correlation": 0.20,
+    "engagement_authenticity": 0.15,
+    "temporal_consistency": 0.10,
+    "content_quality": 0.10,
+}
+
+# Trust signals combined into a story's score, in scoring order
+SIGNAL_TYPES = tuple(_SIGNAL_WEIGHTS)
+
+# TrustScorer method that calculates each trust signal
+_SIGNAL_ANALYZERS = {
+    "source_credibility": "_calculate_source_credibility",
+    "velocity_pattern": "_analyze_velocity_pattern",
+    "cross_platform_correlation": "_analyze_cross_platform_correlation",
+    "engagement_authenticity": "_analyze_engagement_authenticity",
+    "temporal_consistency": "_analyze_temporal_consistency",
+    "content_quality": "_analyze_content_quality",
+}
+
+# Human-readable explanation per signal, formatted with the percentage
+_EXPLANATION_TEMPLATES = {
+    "source_credibility": (
+        "Source credibility: {pct}% - Based on historical accuracy of sources"
+    ),
+    "velocity_pattern": (
+        "Velocity pattern: {pct}% - Analysis of spread pattern authenticity"
+    ),
+    "cross_platform_correlation": (
+        "Cross-platform correlation: {pct}% - Consistency across social platforms"
+    ),
+    "engagement_authenticity": (
+        "Engagement authenticity: {pct}% - "
+        "Bot detection and genuine interaction analysis"
+    ),
+    "temporal_consistency": "Temporal consistency: {pct}% - Story stability over time",
+    "content_quality": (
+        "Content quality: {pct}% - Completeness and attribution assessment"
+    ),
+}
+
+# Every signal needs a weight, an analyzer and an explanation
+if not (set(SIGNAL_TYPES) == set(_SIGNAL_ANALYZERS) == set(_EXPLANATION_TEMPLATES)):
+    msg = "Trust signal weights, analyzers and explanations must cover the same signals"
+    raise RuntimeError(msg)
+
+# Bot detection result for an empty batch; suspicious_accounts is added per call
+# so callers never share a mutable list
+_EMPTY_BOT_RESULT = MappingProxyType(
+    {
+        "bot_probability": 0.0,
+        "coordinated_campaign": False,
+        "total_accounts_analyzed": 0,
+        "analysis": "No posts provided for analysis",
+    }
+)
+
+# Velocity thresholds (mentions per hour) and velocity pattern scores
+_VELOCITY_THRESHOLDS = (0.1, 1.0, 10.0)
+_VELOCITY_SCORES = (
+    0.8,  # Slow, organic spread
+    0.9,  # Moderate viral spread
+    0.6,  # Fast spread - could be artificial
+    0.3,  # Very fast - likely artificial amplification
+)
+
+# Correlation score thresholds and the trust adjustment applied above each
+_CORRELATION_THRESHOLDS = (0.3, 0.5, 0.7)
+_CORRELATION_ADJUSTMENTS = (
+    -0.1,  # Slight decrease for weak correlation
+    0.05,  # Small boost
+    0.1,  # Moderate boost
+    0.2,  # Significant boost
+)
+
+# Story age bucket boundaries (hours) and temporal consistency scores
+_AGE_BUCKETS_HOURS = (1.0, 24.0)
+_AGE_SCORES = (
+    0.6,  # Too new to assess
+    0.8,  # Recent, likely consistent
+    0.9,  # Mature story, proven consistent
+)
+
+
+def _score_accounts(
+    post_counts: np.ndarray,
+    avg_ratios: np.ndarray,
+    has_ratios: np.ndarray,
+    post_time_counts: np.ndarray,
+) -> np.ndarray:
+    """Compute bot suspicion scores for all accounts from aggregated stats."""
+    suspicion_scores = np.zeros(len(post_counts))
+
+    # High posting frequency
+    suspicion_scores += np.where(post_counts > 10, 0.3, 0.0)
+
+    # Unusual engagement ratios
+    unusual_ratios = has_ratios & ((avg_ratios < 0.1) | (avg_ratios > 10))
+    suspicion_scores += np.where(unusual_ratios, 0.4, 0.0)
+
+    # Timing analysis (placeholder)
+    # In production, analyze posting intervals for bot-like patterns
+    suspicion_scores += np.where(post_time_counts > 5, 0.2, 0.0)
+
+    return suspicion_scores
+
 
 class TrustScorer:
     """
@@ -33,14 +144,7 @@ class TrustScorer:
     """
 
     def __init__(self):
-        self.signal_weights = {
-            "source_credibility": 0.25,
-            "velocity_pattern": 0.20,
-            "cross_platform_correlation": 0.20,
-            "engagement_authenticity": 0.15,
-            "temporal_consistency": 0.10,
-            "content_quality": 0.10,
-        }
+        self.signal_weights = dict(_SIGNAL_WEIGHTS)
 
         # Bot detection thresholds
         self.bot_detection_thresholds = {
@@ -66,20 +170,9 @@ class TrustScorer:
 
         try:
             # Calculate individual trust signals
-            signals["source_credibility"] = await self._calculate_source_credibility(
-                story
-            )
-            signals["velocity_pattern"] = await self._analyze_velocity_pattern(story)
-            signals[
-                "cross_platform_correlation"
-            ] = await self._analyze_cross_platform_correlation(story)
-            signals[
-                "engagement_authenticity"
-            ] = await self._analyze_engagement_authenticity(story)
-            signals["temporal_consistency"] = await self._analyze_temporal_consistency(
-                story
-            )
-            signals["content_quality"] = await self._analyze_content_quality(story)
+            for signal_type in SIGNAL_TYPES:
+                analyzer = getattr(self, _SIGNAL_ANALYZERS[signal_type])
+                signals[signal_type] = await analyzer(story)
 
             # Calculate weighted composite score
             composite_score = 0.0
@@ -154,19 +247,28 @@ class TrustScorer:
             # Analyze velocity pattern (organic vs. artificial)
             # Natural viral content follows power law distribution
             # Artificial amplification shows sudden spikes
-
-            if velocity < 0.1:
-                return 0.8  # Slow, organic spread
-            if velocity < 1.0:
-                return 0.9  # Moderate viral spread
-            if velocity < 10.0:
-                return 0.6  # Fast spread - could be artificial
-            return 0.3  # Very fast - likely artificial amplification
+            return _VELOCITY_SCORES[bisect.bisect_right(_VELOCITY_THRESHOLDS, velocity)]
 
         except Exception as e:
             logger.exception(f"Error analyzing velocity pattern: {e}")
             return None
 
+    def analyze_velocity_batch(self, velocities: np.ndarray) -> np.ndarray:
+        """
+        Score velocity patterns for many stories at once.
+
+        Args:
+            velocities: Story velocities, with NaN for unknown values
+
+        Returns:
+            Array of velocity pattern scores, NaN where velocity is unknown
+        """
+        velocities = np.asarray(velocities, dtype=float)
+        scores = np.asarray(_VELOCITY_SCORES)[
+            np.searchsorted(_VELOCITY_THRESHOLDS, velocities, side="right")
+        ]
+        return np.where(np.isnan(velocities), np.nan, scores)
+
     async def _analyze_cross_platform_correlation(
         self, _story: StoryResponse
     ) -> float | None:
@@ -211,11 +313,7 @@ class TrustScorer:
             )
             hours_since = time_since_creation.total_seconds() / 3600
 
-            if hours_since < 1:
-                return 0.6  # Too new to assess
-            if hours_since < 24:
-                return 0.8  # Recent, likely consistent
-            return 0.9  # Mature story, proven consistent
+            return _AGE_SCORES[bisect.bisect_right(_AGE_BUCKETS_HOURS, hours_since)]
 
         except Exception as e:
             logger.exception(f"Error analyzing temporal consistency: {e}")
@@ -249,42 +347,21 @@ class TrustScorer:
             return f"{signal_type}: Insufficient data for analysis"
 
         value_percentage = round(value * 100, 1)
+        template = _EXPLANATION_TEMPLATES.get(signal_type)
 
-        explanations = {
-            "source_credibility": (
-                f"Source credibility: {value_percentage}% - "
-                "Based on historical accuracy of sources"
-            ),
-            "velocity_pattern": (
-                f"Velocity pattern: {value_percentage}% - "
-                "Analysis of spread pattern authenticity"
-            ),
-            "cross_platform_correlation": (
-                f"Cross-platform correlation: {value_percentage}% - "
-                "Consistency across social platforms"
-            ),
-            "engagement_authenticity": (
-                f"Engagement authenticity: {value_percentage}% - "
-                "Bot detection and genuine interaction analysis"
-            ),
-            "temporal_consistency": (
-                f"Temporal consistency: {value_percentage}% - Story stability over time"
-            ),
-            "content_quality": (
-                f"Content quality: {value_percentage}% - "
-                "Completeness and attribution assessment"
-            ),
-        }
-
-        return explanations.get(signal_type, f"{signal_type}: {value_percentage}%")
+        if template is None:
+            return f"{signal_type}: {value_percentage}%"
+        return template.format(pct=value_percentage)
 
     def _calculate_confidence(self, signals: dict[str, float | None]) -> float:
         """Calculate confidence level in the trust score."""
-        available_signals = sum(1 for v in signals.values() if v is not None)
-        total_signals = len(signals)
+        if not signals:
+            return 0.0
+
+        available_signals = sum(v is not None for v in signals.values())
 
         # Confidence based on data availability
-        data_confidence = available_signals / total_signals
+        data_confidence = available_signals / len(signals)
 
         # Additional confidence factors could include:
         # - Data freshness
@@ -293,6 +370,24 @@ class TrustScorer:
 
         return min(1.0, data_confidence)
 
+    def _calculate_confidence_batch(self, signals_matrix: np.ndarray) -> np.ndarray:
+        """
+        Calculate confidence levels for many stories at once.
+
+        Args:
+            signals_matrix: One row per story, one column per signal (ordered as
+                SIGNAL_TYPES), with NaN for signals that could not be calculated
+
+        Returns:
+            Array of confidence levels, one per story
+        """
+        signals_matrix = np.asarray(signals_matrix, dtype=float)
+        if signals_matrix.shape[1] == 0:
+            return np.zeros(signals_matrix.shape[0])
+
+        available_signals = np.count_nonzero(~np.isnan(signals_matrix), axis=1)
+        return available_signals / signals_matrix.shape[1]
+
     async def detect_bots(self, posts: list[dict[str, Any]]) -> dict[str, Any]:
         """
         Detect bot activity and coordinated campaigns in posts.
@@ -303,72 +398,71 @@ class TrustScorer:
         Returns:
             Dict with bot detection results
         """
-        try:
-            if not posts:
-                return {
-                    "bot_probability": 0.0,
-                    "coordinated_campaign": False,
-                    "suspicious_accounts": [],
-                    "analysis": "No posts provided for analysis",
-                }
+        if not posts:
+            return {**_EMPTY_BOT_RESULT, "suspicious_accounts": []}
 
-            # Analyze posting patterns
-            account_stats = defaultdict(
-                lambda: {
-                    "post_count": 0,
-                    "post_times": [],
-                    "content_similarity": [],
-                    "engagement_ratios": [],
-                }
+        try:
+            # Map each post to an account index (first-seen order)
+            account_index: dict[Any, int] = {}
+            author_ids = np.fromiter(
+                (
+                    account_index.setdefault(
+                        post.get("author", "unknown"), len(account_index)
+                    )
+                    for post in posts
+                ),
+                dtype=np.intp,
+                count=len(posts),
+            )
+            accounts = list(account_index)
+            num_accounts = len(accounts)
+
+            # Collect account statistics in a single vectorized pass
+            # Missing or null engagement counts are treated as zero
+            engagements = [post.get("engagement", {}) for post in posts]
+            likes = np.array([e.get("likes") or 0 for e in engagements], dtype=float)
+            retweets = np.array(
+                [e.get("retweets") or 0 for e in engagements], dtype=float
+            )
+            has_time = np.fromiter(
+                ("created_at" in post for post in posts), dtype=bool, count=len(posts)
             )
 
-            # Collect account statistics
-            for post in posts:
-                author = post.get("author", "unknown")
-                account_stats[author]["post_count"] += 1
-
-                if "created_at" in post:
-                    account_stats[author]["post_times"].append(post["created_at"])
-
-                # Analyze engagement patterns
-                engagement = post.get("engagement", {})
-                likes = engagement.get("likes", 0)
-                retweets = engagement.get("retweets", 0)
+            post_counts = np.bincount(author_ids, minlength=num_accounts)
+            post_time_counts = np.bincount(
+                author_ids, weights=has_time, minlength=num_accounts
+            )
 
-                if retweets > 0:
-                    ratio = likes / retweets
-                    account_stats[author]["engagement_ratios"].append(ratio)
+            # Engagement ratios only count posts with retweets, and non-finite
+            # counts must never poison an account's average ratio
+            rated = (retweets > 0) & np.isfinite(likes) & np.isfinite(retweets)
+            ratios = np.divide(likes, retweets, out=np.zeros_like(likes), where=rated)
+            ratio_sums = np.bincount(author_ids, weights=ratios, minlength=num_accounts)
+            ratio_counts = np.bincount(
+                author_ids, weights=rated, minlength=num_accounts
+            )
+            has_ratios = ratio_counts > 0
+            avg_ratios = np.divide(
+                ratio_sums,
+                ratio_counts,
+                out=np.ones(num_accounts),
+                where=has_ratios,
+            )
 
             # Detect suspicious patterns
-            suspicious_accounts = []
-            coordinated_indicators = 0
+            suspicion_scores = _score_accounts(
+                post_counts, avg_ratios, has_ratios, post_time_counts
+            )
 
-            for account, stats in account_stats.items():
-                suspicion_score = 0.0
-
-                # High posting frequency
-                if stats["post_count"] > 10:
-                    suspicion_score += 0.3
-
-                # Unusual engagement ratios
-                if stats["engagement_ratios"]:
-                    avg_ratio = statistics.mean(stats["engagement_ratios"])
-                    if avg_ratio < 0.1 or avg_ratio > 10:  # Unusual ratios
-                        suspicion_score += 0.4
-
-                # Timing analysis (placeholder)
-                if len(stats["post_times"]) > 5:
-                    # In production, analyze posting intervals for bot-like patterns
-                    suspicion_score += 0.2
-
-                if suspicion_score > 0.5:
-                    suspicious_accounts.append(
-                        {
-                            "account": account,
-                            "suspicion_score": suspicion_score,
-                            "post_count": stats["post_count"],
-                        }
-                    )
+            suspicious_accounts = [
+                {
+                    "account": accounts[i],
+                    "suspicion_score": float(suspicion_scores[i]),
+                    "post_count": int(post_counts[i]),
+                }
+                for i in np.flatnonzero(suspicion_scores > 0.5)
+            ]
+            coordinated_indicators = 0
 
             # Detect coordinated campaigns
             coordinated_campaign = len(suspicious_accounts) > 5
@@ -381,9 +475,7 @@ class TrustScorer:
                 coordinated_indicators += 1
 
             # Calculate overall bot probability
-            bot_probability = min(
-                1.0, len(suspicious_accounts) / max(len(account_stats), 1)
-            )
+            bot_probability = min(1.0, len(suspicious_accounts) / max(num_accounts, 1))
 
             # Boost probability for coordinated indicators
             if coordinated_indicators > 0:
@@ -395,10 +487,10 @@ class TrustScorer:
                 "bot_probability": round(bot_probability, 3),
                 "coordinated_campaign": coordinated_campaign,
                 "suspicious_accounts": suspicious_accounts[:10],  # Limit output
-                "total_accounts_analyzed": len(account_stats),
+                "total_accounts_analyzed": num_accounts,
                 "coordinated_indicators": coordinated_indicators,
                 "analysis": (
-                    f"Analyzed {len(posts)} posts from {len(account_stats)} accounts"
+                    f"Analyzed {len(posts)} posts from {num_accounts} accounts"
                 ),
             }
 
@@ -429,14 +521,9 @@ class TrustScorer:
             correlation_score = correlation.get("correlation_score", 0.0)
 
             # Positive correlation with mainstream news increases trust
-            if correlation_score > 0.7:
-                adjustment = 0.2  # Significant boost
-            elif correlation_score > 0.5:
-                adjustment = 0.1  # Moderate boost
-            elif correlation_score > 0.3:
-                adjustment = 0.05  # Small boost
-            else:
-                adjustment = -0.1  # Slight decrease for weak correlation
+            adjustment = _CORRELATION_ADJUSTMENTS[
+                bisect.bisect_left(_CORRELATION_THRESHOLDS, correlation_score)
+            ]
 
             updated_score = max(0.0, min(1.0, current_score + adjustment))
 
@@ -450,3 +537,29 @@ class TrustScorer:
         except Exception as e:
             logger.exception(f"Error updating trust score with correlation: {e}")
             return article.get("trust_score", 0.5)
+
+    def update_with_correlation_batch(
+        self, trust_scores: np.ndarray, correlation_scores: np.ndarray
+    ) -> np.ndarray:
+        """
+        Update many trust scores based on news correlation at once.
+
+        Args:
+            trust_scores: Current trust scores (0-1)
+            correlation_scores: Correlation score for each trust score
+
+        Returns:
+            Array of updated trust scores
+        """
+        trust_scores = np.asarray(trust_scores, dtype=float)
+        correlation_scores = np.asarray(correlation_scores, dtype=float)
+        adjustments = np.asarray(_CORRELATION_ADJUSTMENTS)[
+            np.searchsorted(_CORRELATION_THRESHOLDS, correlation_scores, side="left")
+        ]
+
+        # searchsorted places NaN past every threshold; a missing correlation
+        # must count as weak, as in the scalar path, never as a boost
+        adjustments = np.where(
+            np.isnan(correlation_scores), _CORRELATION_ADJUSTMENTS[0], adjustments
+        )
+        return np.clip(trust_scores + adjustments, 0.0, 1.0)
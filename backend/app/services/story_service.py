@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, insert, select
 
 from app.core.logging import get_logger
 from app.models.sql_models import Correlation, Story, TrustSignal
@@ -231,17 +231,23 @@ class StoryService:
         story.trust_score = new_score
         story.last_updated_at = datetime.utcnow()
 
-        # Add trust signals
-        for signal_data in signals:
-            trust_signal = TrustSignal(
-                story_id=story_id,
-                signal_type=signal_data["type"],
-                value=signal_data["value"],
-                weight=signal_data.get("weight", 1.0),
-                explanation=signal_data.get("explanation"),
-                calculated_at=datetime.utcnow(),
+        # Add trust signals in a single executemany round-trip
+        if signals:
+            calculated_at = datetime.utcnow()
+            await self.db.execute(
+                insert(TrustSignal),
+                [
+                    {
+                        "story_id": story_id,
+                        "signal_type": signal_data["type"],
+                        "value": signal_data["value"],
+                        "weight": signal_data.get("weight", 1.0),
+                        "explanation": signal_data.get("explanation"),
+                        "calculated_at": calculated_at,
+                    }
+                    for signal_data in signals
+                ],
             )
-            self.db.add(trust_signal)
 
         await self.db.commit()
         logger.info(f"Updated trust score for story {story_id}: {new_score}")
@@ -2,11 +2,22 @@
 """Test WebSocket functionality."""
 
 import asyncio
-import json
+import aiohttp
+import orjson
+import socket
 import websockets
 import time
 
 
+def server_is_reachable(host='localhost', port=8000, timeout=0.1):
+    """Check quickly whether the backend accepts TCP connections."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 async def test_websocket_connection():
     """Test basic WebSocket connection and messaging."""
     uri = "ws://localhost:8000/api/v1/ws/v2/connect?channel=test"
@@ -15,33 +26,33 @@ async def test_websocket_connection():
     async with websockets.connect(uri) as websocket:
         # Wait for connection message
         message = await websocket.recv()
-        data = json.loads(message)
+        data = orjson.loads(message)
         print(f"   ✓ Connected: {data['type']} on channel {data.get('channel')}")
         
         # Test ping-pong
         print("\n2. Testing heartbeat (ping-pong)...")
         ping_msg = await websocket.recv()
-        ping_data = json.loads(ping_msg)
+        ping_data = orjson.loads(ping_msg)
         if ping_data['type'] == 'ping':
-            await websocket.send(json.dumps({'type': 'pong'}))
+            await websocket.send(orjson.dumps({'type': 'pong'}).decode())
             print("   ✓ Received ping, sent pong")
         
         # Test subscription
         print("\n3. Testing channel subscription...")
-        await websocket.send(json.dumps({
+        await websocket.send(orjson.dumps({
             'type': 'subscribe',
             'channel': 'stories'
-        }))
+        }).decode())
         sub_response = await websocket.recv()
-        sub_data = json.loads(sub_response)
+        sub_data = orjson.loads(sub_response)
         print(f"   ✓ Subscribed to channel: {sub_data}")
         
         # Test echo
         print("\n4. Testing message echo...")
         test_msg = {'type': 'test', 'data': 'Hello WebSocket!'}
-        await websocket.send(json.dumps(test_msg))
+        await websocket.send(orjson.dumps(test_msg).decode())
         echo_response = await websocket.recv()
-        echo_data = json.loads(echo_response)
+        echo_data = orjson.loads(echo_response)
         print(f"   ✓ Echo received: {echo_data}")
         
         print("\n✅ Basic WebSocket tests passed!")
@@ -56,57 +67,71 @@ async def test_rate_limiting():
         # Skip initial connection message
         await websocket.recv()
         
-        messages_sent = 0
-        rate_limited = False
-        
-        for i in range(105):
-            await websocket.send(json.dumps({
-                'type': 'test',
-                'data': f'Message {i}'
-            }))
-            messages_sent += 1
-            
-            # Check for response
+        async def sender():
+            for i in range(105):
+                await websocket.send(orjson.dumps({
+                    'type': 'test',
+                    'data': f'Message {i}'
+                }).decode())
+
+        async def receiver():
+            # Drain responses concurrently until the rate limit error arrives;
+            # every message the server accepted was echoed back first
+            echoes = 0
             try:
-                response = await asyncio.wait_for(websocket.recv(), timeout=0.1)
-                data = json.loads(response)
-                if data.get('type') == 'error' and 'Rate limit' in data.get('message', ''):
-                    rate_limited = True
-                    print(f"   ✓ Rate limited after {messages_sent} messages")
-                    break
-            except asyncio.TimeoutError:
-                continue
-        
-        if rate_limited:
+                while True:
+                    data = orjson.loads(await websocket.recv())
+                    if data.get('type') == 'echo':
+                        echoes += 1
+                    elif data.get('type') == 'error' and 'Rate limit' in data.get('message', ''):
+                        return echoes + 1
+            except websockets.exceptions.ConnectionClosed:
+                return None
+
+        send_task = asyncio.create_task(sender())
+        recv_task = asyncio.create_task(receiver())
+        await send_task
+
+        # Give in-flight responses a moment to arrive after the last send
+        done, _ = await asyncio.wait({recv_task}, timeout=1.0)
+        recv_task.cancel()
+
+        limited_after = recv_task.result() if recv_task in done else None
+        if limited_after is not None:
+            print(f"   ✓ Rate limited after {limited_after} messages")
             print("   ✅ Rate limiting works!")
         else:
             print("   ⚠️  Rate limiting may not be triggered (check configuration)")
 
 
-async def test_multiple_connections():
+async def test_multiple_connections(http_session):
     """Test multiple concurrent connections."""
     print("\n6. Testing multiple concurrent connections...")
     
-    connections = []
-    for i in range(5):
-        uri = f"ws://localhost:8000/api/v1/ws/v2/connect?channel=conn_test_{i}"
-        ws = await websockets.connect(uri)
-        connections.append(ws)
-        # Read connection message
-        await ws.recv()
-    
-    print(f"   ✓ Established {len(connections)} concurrent connections")
-    
-    # Check stats
-    import aiohttp
-    async with aiohttp.ClientSession() as session:
-        async with session.get('http://localhost:8000/api/v1/ws/v2/stats') as resp:
+    results = await asyncio.gather(*(
+        websockets.connect(f"ws://localhost:8000/api/v1/ws/v2/connect?channel=conn_test_{i}")
+        for i in range(5)
+    ), return_exceptions=True)
+    connections = [r for r in results if not isinstance(r, BaseException)]
+
+    try:
+        # Re-raise the first failed handshake once the rest are tracked for closing
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Read connection messages
+        await asyncio.gather(*(ws.recv() for ws in connections))
+        
+        print(f"   ✓ Established {len(connections)} concurrent connections")
+        
+        # Check stats
+        async with http_session.get('http://localhost:8000/api/v1/ws/v2/stats') as resp:
             stats = await resp.json()
             print(f"   ✓ Stats: {stats}")
-    
-    # Close all connections
-    for ws in connections:
-        await ws.close()
+    finally:
+        # Close every connection that opened, even if a step above failed
+        await asyncio.gather(*(ws.close() for ws in connections))
     
     print("   ✅ Multiple connections test passed!")
 
@@ -117,10 +142,16 @@ async def main():
     print("WebSocket Testing Suite")
     print("=" * 50)
     
+    if not server_is_reachable():
+        print("\n⚠️  Server not reachable on localhost:8000 - skipping WebSocket tests")
+        return
+
     try:
-        await test_websocket_connection()
-        await test_rate_limiting()
-        await test_multiple_connections()
+        # One HTTP session shared by every test that calls the REST API
+        async with aiohttp.ClientSession() as http_session:
+            await test_websocket_connection()
+            await test_rate_limiting()
+            await test_multiple_connections(http_session)
         
         print("\n" + "=" * 50)
         print("🎉 All WebSocket tests completed!")